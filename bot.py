@@ -13,10 +13,17 @@ Key Features:
 import os
 import logging
 import asyncio
+import contextlib
 from datetime import datetime
 from functools import wraps
 import time
 
+# uvloop is optional (not available on Windows); fall back to the stock event loop
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 from telegram import Update
 from telegram.ext import (
     Application,
@@ -25,7 +32,7 @@ from telegram.ext import (
     filters,
     ContextTypes
 )
-from telegram.error import TelegramError
+from telegram.error import RetryAfter, TelegramError
 
 # Import local modules
 from utils import (
@@ -38,15 +45,17 @@ from utils import (
     is_admin,
     calculate_week_number,
     get_current_week,
+    parse_int_arg,
     SensitiveFormatter
 )
 from data_manager import (
-    add_submission,
+    add_submissions_bulk,
+    PendingSubmission,
     load_submissions,
-    save_config,
-    load_config,
+    get_show_points,
+    set_show_points,
     get_leaderboard,
-    save_week_winners,
+    select_week_winners,
     get_week_winners,
     get_stats
 )
@@ -60,16 +69,12 @@ from leaderboard import (
 )
 
 # Configure logging with sensitive data masking
-logging.basicConfig(
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    level=logging.INFO
-)
+logging.basicConfig(level=logging.INFO)
 
-# Apply sensitive formatter to root logger
+# Apply sensitive formatter to every root handler, including any configured before import
+_log_formatter = SensitiveFormatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 for handler in logging.getLogger().handlers:
-    handler.setFormatter(SensitiveFormatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-    ))
+    handler.setFormatter(_log_formatter)
 
 # Reduce noise from httpx and telegram libraries
 logging.getLogger("httpx").setLevel(logging.WARNING)
@@ -82,11 +87,111 @@ BOT_TOKEN = os.getenv('BOT_TOKEN')
 if not BOT_TOKEN:
     raise ValueError("BOT_TOKEN environment variable is required")
 
+# Held for the whole of a /scan or /backfill run. Both probe through the same admin
+# chat, so overlapping runs would double the paced request rate and interleave probes.
+SCAN_LOCK = asyncio.Lock()
+SCAN_BUSY_TEXT = "⏳ A scan is already running. Wait for it to finish before starting another."
+
+# Backfill writes submissions in batches of this size (one file rewrite per batch)
+SCAN_FLUSH_SIZE = max(1, int(os.getenv('SCAN_FLUSH_SIZE', '50')))
+
+# Live photos arriving within this many seconds of each other share one file rewrite
+LIVE_FLUSH_DELAY = float(os.getenv('LIVE_FLUSH_DELAY', '0.25'))
+
+# Live submissions waiting for the next group write, as (PendingSubmission, Future) pairs
+_live_pending = []
+_live_flush_tasks = set()
+
+# Reply templates, built once at import; only the dynamic fields are filled per call
+DEBUG_TEMPLATE = (
+    "🔧 Debug Information\n"
+    "\n"
+    "📅 Current Time (IST): {now}\n"
+    f"📅 Campaign Start: {CAMPAIGN_START.strftime('%Y-%m-%d %H:%M:%S %Z')}\n"
+    f"📅 Campaign End: {CAMPAIGN_END.strftime('%Y-%m-%d %H:%M:%S %Z')}\n"
+    "📊 Current Week: {week}\n"
+    "\n"
+    "{status}\n"
+    "\n"
+    f"💬 Target Chat ID: {CHAT_ID}\n"
+    f"🎯 Target Topic ID: {TOPIC_ID}\n"
+    f"👨‍💼 Admin IDs: {', '.join(map(str, ADMIN_IDS))}\n"
+    "\n"
+    "✅ Bot is running and receiving commands!\n"
+    "\n"
+    "💡 To test real-time tracking:\n"
+    f"• Post a PnL card photo in topic {TOPIC_ID}\n"
+    "• Check Railway logs for '📸 Photo received' message\n"
+    "• Should see '✅✅ NEW SUBMISSION ADDED' if successful"
+)
+
+STATS_TEMPLATE = (
+    "📊 Campaign Statistics\n"
+    "\n"
+    "👥 Total Participants: {total_participants}\n"
+    "📸 Total Submissions: {total_submissions}\n"
+    "📅 Campaign Start: {campaign_start}\n"
+    "🔄 Last Updated: {last_updated}"
+)
+
+SCAN_USAGE = (
+    "📡 Usage: /scan <start_id> <end_id>\n\n"
+    "Example: /scan 103380 103580\n\n"
+    "⚠️ IMPORTANT - Run this command IN the topic you want to scan!\n"
+    "• Go to PnL Flex Challenge topic\n"
+    "• Find start ID: Right-click FIRST PnL card → Copy Link\n"
+    "• Find end ID: Right-click LATEST PnL card → Copy Link\n"
+    "• Type /scan <start> <end> IN THAT TOPIC\n\n"
+)
+
+CHECKMSG_USAGE = (
+    "Usage: /checkmsg <message_id>\n\n"
+    "Example: /checkmsg 103450\n\n"
+    "This helps you verify if a message ID is from the PnL Flex Challenge topic.\n"
+    "Use this to find the correct first/last message IDs for /scan."
+)
+
 
 # ============================================================================
 # CRASH-RESISTANT BACKFILL (RUNS ON EVERY STARTUP)
 # ============================================================================
 
+async def safe_send(bot_method, chat_id, **kwargs):
+    """
+    Call a Bot API send method, waiting out flood limits.
+
+    Telegram answers bursts with RetryAfter (HTTP 429); sleep for the
+    requested time and retry once instead of dropping the call.
+
+    Args:
+        bot_method: Bound bot method, e.g. bot.send_message
+        chat_id: Target chat ID
+        **kwargs: Remaining arguments for the method
+    """
+    try:
+        return await bot_method(chat_id=chat_id, **kwargs)
+    except RetryAfter as e:
+        logger.warning(f"⏳ Flood limit hit for chat {chat_id}, retrying in {e.retry_after}s")
+        await asyncio.sleep(e.retry_after)
+        return await bot_method(chat_id=chat_id, **kwargs)
+
+
+async def forward_probe(bot, probe_chat_id, msg_id):
+    """Forward a campaign chat message to the probe chat"""
+    return await safe_send(
+        bot.forward_message,
+        probe_chat_id,
+        from_chat_id=CHAT_ID,
+        message_id=msg_id
+    )
+
+
+async def delete_probe(bot, probe_chat_id, message_id):
+    """Delete a forwarded probe message; a failed delete only leaves clutter"""
+    with contextlib.suppress(TelegramError):
+        await bot.delete_message(chat_id=probe_chat_id, message_id=message_id)
+
+
 async def smart_backfill(application: Application, scan_range=None):
     """
     Self-healing sync mechanism with message ID range scanning.
@@ -109,7 +214,7 @@ async def smart_backfill(application: Application, scan_range=None):
     - Historical message backfill
     """
     logger.info("🔄 Starting smart backfill with message ID scanner...")
-    start_time = time.time()
+    start_time = time.monotonic()
 
     # Load existing data
     data = load_submissions()
@@ -137,8 +242,10 @@ async def smart_backfill(application: Application, scan_range=None):
     logger.info(f"📡 Scanning message IDs from {start_id} to {end_id}")
 
     # Collect processed messages
-    processed_messages = []
+    pending = []  # bounded: flushed every SCAN_FLUSH_SIZE items
+    seen_photos = set()
     new_submissions = 0
+    duplicate_photos = 0
     skipped_messages = 0
     errors = 0
 
@@ -153,7 +260,7 @@ async def smart_backfill(application: Application, scan_range=None):
             'total_found': existing_count,
             'existing_count': existing_count,
             'new_count': 0,
-            'duration': time.time() - start_time,
+            'duration': time.monotonic() - start_time,
             'top_3': [],
             'total_users': len(data['users']),
             'date_range': 'Unable to scan - no admin configured',
@@ -171,7 +278,7 @@ async def smart_backfill(application: Application, scan_range=None):
         # Progress logging every 50 messages
         if (msg_id - start_id) % 50 == 0:
             progress = ((msg_id - start_id) / total_range) * 100
-            logger.info(f"📊 Progress: {progress:.1f}% ({msg_id - start_id}/{total_range})")
+            logger.info("📊 Progress: %.1f%% (%d/%d)", progress, msg_id - start_id, total_range)
 
         # Skip if already processed
         if msg_id in existing_message_ids:
@@ -181,22 +288,12 @@ async def smart_backfill(application: Application, scan_range=None):
         try:
             # Probe: Try to forward message to get its info
             # This is a workaround for Bot API's lack of direct message fetching
-            forwarded = await application.bot.forward_message(
-                chat_id=probe_chat_id,
-                from_chat_id=CHAT_ID,
-                message_id=msg_id
-            )
+            forwarded = await forward_probe(application.bot, probe_chat_id, msg_id)
 
             # IMPORTANT: Check if message has photos first
             if not forwarded.photo:
                 # Not a photo, delete and skip
-                try:
-                    await application.bot.delete_message(
-                        chat_id=probe_chat_id,
-                        message_id=forwarded.message_id
-                    )
-                except Exception:
-                    pass
+                await delete_probe(application.bot, probe_chat_id, forwarded.message_id)
                 continue
 
             # Check if forwarded message is from the correct chat
@@ -204,14 +301,8 @@ async def smart_backfill(application: Application, scan_range=None):
             # and forward_from_message_id will be the original message ID
             if not forwarded.forward_from_chat or forwarded.forward_from_chat.id != CHAT_ID:
                 # Not from our target chat, delete and skip
-                try:
-                    await application.bot.delete_message(
-                        chat_id=probe_chat_id,
-                        message_id=forwarded.message_id
-                    )
-                except Exception:
-                    pass
-                logger.debug(f"Message {msg_id} not from target chat, skipping")
+                await delete_probe(application.bot, probe_chat_id, forwarded.message_id)
+                logger.debug("Message %s not from target chat, skipping", msg_id)
                 continue
 
             # Since we can't reliably check topic ID from forwarded messages,
@@ -224,7 +315,7 @@ async def smart_backfill(application: Application, scan_range=None):
                 original_user = forwarded.forward_from or forwarded.forward_sender_name
 
                 if not original_user:
-                    logger.debug(f"Message {msg_id} has no sender info, skipping")
+                    logger.debug("Message %s has no sender info, skipping", msg_id)
                     continue
 
                 # Extract user info
@@ -234,7 +325,7 @@ async def smart_backfill(application: Application, scan_range=None):
                     full_name = original_user.full_name or "Unknown"
                 else:
                     # Anonymous forward or sender name only
-                    logger.debug(f"Message {msg_id} is anonymous, skipping")
+                    logger.debug("Message %s is anonymous, skipping", msg_id)
                     continue
 
                 # Get photo_id (largest size)
@@ -245,39 +336,37 @@ async def smart_backfill(application: Application, scan_range=None):
 
                 # Check if within campaign period
                 if timestamp < CAMPAIGN_START or timestamp > CAMPAIGN_END:
-                    logger.debug(f"Message {msg_id} outside campaign period")
+                    logger.debug("Message %s outside campaign period", msg_id)
                     continue
 
                 # Calculate week number
                 week = calculate_week_number(timestamp)
                 if week is None:
-                    logger.warning(f"Could not calculate week for message {msg_id}")
+                    logger.warning("Could not calculate week for message %s", msg_id)
                     continue
 
-                # Add submission (idempotent)
-                added = add_submission(
-                    user_id=user_id,
-                    username=username,
-                    full_name=full_name,
-                    message_id=msg_id,
-                    photo_id=photo_id,
-                    timestamp=timestamp,
-                    week=week
-                )
-
-                if added:
-                    new_submissions += 1
-                    processed_messages.append(msg_id)
-                    logger.info(f"✅ Processed: msg={msg_id}, user={username}, week={week}")
+                # Queue submission; written in batches to avoid one file rewrite per photo.
+                # Photos are unique per user, so repeats within this scan never reach the file.
+                photo_key = (user_id, photo_id)
+                if photo_key in seen_photos:
+                    duplicate_photos += 1
+                else:
+                    seen_photos.add(photo_key)
+                    pending.append(PendingSubmission(
+                        user_id=user_id,
+                        username=username,
+                        full_name=full_name,
+                        message_id=msg_id,
+                        photo_id=photo_id,
+                        timestamp=timestamp,
+                        week=week
+                    ))
+
+                if len(pending) >= SCAN_FLUSH_SIZE:
+                    new_submissions += len(await flush_pending_submissions(pending))
 
                 # Delete the forwarded probe message to keep chat clean
-                try:
-                    await application.bot.delete_message(
-                        chat_id=probe_chat_id,
-                        message_id=forwarded.message_id
-                    )
-                except Exception:
-                    pass  # Ignore deletion errors
+                await delete_probe(application.bot, probe_chat_id, forwarded.message_id)
 
             # Rate limiting: small delay every batch
             if (msg_id - start_id) % batch_size == 0:
@@ -295,24 +384,27 @@ async def smart_backfill(application: Application, scan_range=None):
             else:
                 errors += 1
                 if errors < 10:  # Only log first 10 errors to avoid spam
-                    logger.debug(f"Error probing message {msg_id}: {e}")
+                    logger.debug("Error probing message %s: %s", msg_id, e)
 
         except Exception as e:
-            logger.error(f"Unexpected error processing message {msg_id}: {e}")
+            logger.error("Unexpected error processing message %s: %s", msg_id, e)
             errors += 1
 
+    # Write whatever is left from the last partial batch
+    new_submissions += len(await flush_pending_submissions(pending))
+
     # Calculate final stats
-    duration = time.time() - start_time
+    duration = time.monotonic() - start_time
     total_found = existing_count + new_submissions
 
-    # Reload data to get updated user count
-    data = load_submissions()
+    # Reload data to get updated user count (unchanged if nothing was added)
+    if new_submissions:
+        data = load_submissions()
 
     # Get top 3 for notification
     current_week = get_current_week()
     if current_week:
-        leaderboard = get_leaderboard(current_week)
-        top_3 = leaderboard[:3] if leaderboard else []
+        top_3 = get_leaderboard(current_week, limit=3)
     else:
         top_3 = []
 
@@ -334,19 +426,92 @@ async def smart_backfill(application: Application, scan_range=None):
     logger.info(f"✅ Backfill complete in {duration:.1f}s")
     logger.info(f"📊 Scanned: {end_id - start_id} message IDs")
     logger.info(f"📊 Results: {existing_count} existing + {new_submissions} new = {total_found} total submissions")
+    logger.info(f"📊 Duplicate photos skipped: {duplicate_photos}")
     logger.info(f"📊 Errors: {errors}")
 
 
+async def flush_pending_submissions(pending):
+    """
+    Write queued backfill submissions in one bulk save.
+
+    Clears the pending list and returns the message_ids that were added.
+    """
+    if not pending:
+        return []
+
+    # Synchronous load/apply/save with no await, so concurrent handlers can't interleave
+    results = add_submissions_bulk(pending)
+    added = [sub.message_id for sub, ok in zip(pending, results) if ok]
+    pending.clear()
+
+    for msg_id in added:
+        logger.info("✅ Processed: msg=%s", msg_id)
+
+    return added
+
+
+async def queue_live_submission(submission):
+    """
+    Queue a live submission for the next group write and wait for its result.
+
+    The first photo of a burst schedules a flush LIVE_FLUSH_DELAY seconds out;
+    everything queued by then is saved with a single add_submissions_bulk call.
+
+    Returns:
+        bool: True if submission was added, False if duplicate
+    """
+    future = asyncio.get_running_loop().create_future()
+    _live_pending.append((submission, future))
+
+    if len(_live_pending) == 1:
+        task = asyncio.create_task(flush_live_submissions())
+        _live_flush_tasks.add(task)
+        task.add_done_callback(_live_flush_tasks.discard)
+
+    return await future
+
+
+async def flush_live_submissions():
+    """Write all queued live submissions in one bulk save and resolve their futures"""
+    batch = []
+    results = None
+    error = None
+
+    try:
+        await asyncio.sleep(LIVE_FLUSH_DELAY)
+
+        batch = _live_pending[:]
+        _live_pending.clear()
+        results = add_submissions_bulk([submission for submission, _ in batch])
+    except Exception as e:
+        error = e
+    finally:
+        # If this flush was cancelled before taking the batch, take it now so the queue
+        # is empty again and the next live photo schedules a fresh flush
+        if not batch:
+            batch = _live_pending[:]
+            _live_pending.clear()
+
+        for index, (_, future) in enumerate(batch):
+            # Skip waiters whose handler was cancelled meanwhile
+            if future.done():
+                continue
+            if results is not None:
+                # Each waiter gets its own row's result, so a repeat in the batch reads False
+                future.set_result(results[index])
+            elif error is not None:
+                future.set_exception(error)
+            else:
+                future.cancel()
+
+
 async def send_sync_notification(application: Application, sync_stats: dict):
     """Helper function to send sync notifications to all admins"""
     notification = format_sync_notification(sync_stats)
 
     for admin_id in ADMIN_IDS:
         try:
-            await application.bot.send_message(
-                chat_id=admin_id,
-                text=notification
-            )
+            await safe_send(application.bot.send_message, admin_id, text=notification)
             logger.info(f"✅ Sent sync notification to admin {admin_id}")
         except Exception as e:
             logger.error(f"Failed to notify admin {admin_id}: {e}")
@@ -360,9 +525,7 @@ def admin_only(func):
     """Decorator to restrict commands to admins only"""
     @wraps(func)
     async def wrapper(update: Update, context: ContextTypes.DEFAULT_TYPE):
-        user_id = update.effective_user.id
-
-        if not is_admin(user_id):
+        if not is_admin(update.effective_user.id):
             await update.message.reply_text("⛔ This command is admin-only")
             return
 
@@ -397,21 +560,12 @@ async def handle_photo_message(update: Update, context: ContextTypes.DEFAULT_TYP
     message = update.message
 
     # Debug logging
-    logger.info(f"📸 Photo received - Chat: {message.chat_id}, Thread: {message.message_thread_id}, User: {message.from_user.id}")
+    logger.info("📸 Photo received - Chat: %s, Thread: %s, User: %s", message.chat_id, message.message_thread_id, message.from_user.id)
 
-    # Check if message is in the correct chat
-    if message.chat_id != CHAT_ID:
-        logger.debug(f"Skipping: Wrong chat ({message.chat_id} != {CHAT_ID})")
-        return
-
-    # Check if message is in the campaign topic
-    if not message.message_thread_id or message.message_thread_id != TOPIC_ID:
-        logger.debug(f"Skipping: Wrong topic ({message.message_thread_id} != {TOPIC_ID})")
-        return
-
-    # Check if message has photos
-    if not message.photo:
-        logger.debug("Skipping: No photo")
+    # Chat and photo are guaranteed by the handler's filters.PHOTO & filters.Chat(CHAT_ID);
+    # only the topic needs checking here (PTB has no thread-id filter)
+    if message.message_thread_id != TOPIC_ID:
+        logger.debug("Skipping: Wrong topic (%s != %s)", message.message_thread_id, TOPIC_ID)
         return
 
     # Extract message info
@@ -425,22 +579,22 @@ async def handle_photo_message(update: Update, context: ContextTypes.DEFAULT_TYP
     photo_id = message.photo[-1].file_id
 
     # Check if message is within campaign period
-    logger.info(f"Message timestamp: {timestamp}, Campaign: {CAMPAIGN_START} to {CAMPAIGN_END}")
+    logger.info("Message timestamp: %s, Campaign: %s to %s", timestamp, CAMPAIGN_START, CAMPAIGN_END)
 
     if timestamp < CAMPAIGN_START or timestamp > CAMPAIGN_END:
-        logger.warning(f"⏭️ Message {message_id} outside campaign period (posted: {timestamp}), ignoring")
+        logger.warning("⏭️ Message %s outside campaign period (posted: %s), ignoring", message_id, timestamp)
         return
 
     # Calculate week number
     week = calculate_week_number(timestamp)
     if week is None:
-        logger.warning(f"Could not calculate week for message {message_id}")
+        logger.warning("Could not calculate week for message %s", message_id)
         return
 
-    logger.info(f"✅ Valid PnL card! User: {username}, Week: {week}, Msg: {message_id}")
+    logger.info("✅ Valid PnL card! User: %s, Week: %s, Msg: %s", username, week, message_id)
 
     # Add submission (idempotent - checks message_id and photo_id)
-    added = add_submission(
+    added = await queue_live_submission(PendingSubmission(
         user_id=user_id,
         username=username,
         full_name=full_name,
@@ -448,12 +602,12 @@ async def handle_photo_message(update: Update, context: ContextTypes.DEFAULT_TYP
         photo_id=photo_id,
         timestamp=timestamp,
         week=week
-    )
+    ))
 
     if added:
-        logger.info(f"✅✅ NEW SUBMISSION ADDED: user={username} ({user_id}), week={week}, msg={message_id}, points=1")
+        logger.info("✅✅ NEW SUBMISSION ADDED: user=%s (%s), week=%s, msg=%s, points=1", username, user_id, week, message_id)
     else:
-        logger.info(f"⏭️ Duplicate submission ignored: msg={message_id} (already in database)")
+        logger.info("⏭️ Duplicate submission ignored: msg=%s (already in database)", message_id)
 
 
 # ============================================================================
@@ -472,8 +626,7 @@ async def cmd_pnlrank(update: Update, context: ContextTypes.DEFAULT_TYPE):
         return
 
     # Get config for point visibility
-    config = load_config()
-    show_points = config.get('show_points', True)
+    show_points = get_show_points()
 
     # Format leaderboard
     leaderboard_text = format_leaderboard(
@@ -530,9 +683,7 @@ async def cmd_pointson(update: Update, context: ContextTypes.DEFAULT_TYPE):
     /pointson command - Enable points display in public leaderboard
     Admin only, DM only
     """
-    config = load_config()
-    config['show_points'] = True
-    save_config(config)
+    set_show_points(True)
 
     await update.message.reply_text("✅ Points display enabled for public leaderboard")
 
@@ -544,9 +695,7 @@ async def cmd_pointsoff(update: Update, context: ContextTypes.DEFAULT_TYPE):
     /pointsoff command - Disable points display in public leaderboard
     Admin only, DM only
     """
-    config = load_config()
-    config['show_points'] = False
-    save_config(config)
+    set_show_points(False)
 
     await update.message.reply_text("✅ Points display disabled for public leaderboard")
 
@@ -559,41 +708,18 @@ async def cmd_selectwinners(update: Update, context: ContextTypes.DEFAULT_TYPE):
     Admin only, DM only
     """
     # Parse week number from args
-    if not context.args or len(context.args) != 1:
-        await update.message.reply_text("Usage: /selectwinners <week>\nExample: /selectwinners 1")
+    ok, week, error = parse_int_arg(context.args, lo=1, hi=4, label="week")
+    if not ok:
+        await update.message.reply_text(error or "Usage: /selectwinners <week>\nExample: /selectwinners 1")
         return
 
-    try:
-        week = int(context.args[0])
-        if week < 1 or week > 4:
-            raise ValueError()
-    except ValueError:
-        await update.message.reply_text("❌ Week must be a number between 1 and 4")
-        return
-
-    # Get top 5 for the week
-    leaderboard = get_leaderboard(week)
+    # Pick the top 5 and save them to winners.json
+    winners = select_week_winners(week)
 
-    if not leaderboard:
+    if not winners:
         await update.message.reply_text(f"❌ No submissions for Week {week}")
         return
 
-    # Take top 5
-    top_5 = leaderboard[:5]
-
-    # Format winners list
-    winners = []
-    for rank, entry in enumerate(top_5, 1):
-        winners.append({
-            'rank': rank,
-            'username': entry['username'],
-            'full_name': entry['full_name'],
-            'points': entry['points']
-        })
-
-    # Save to winners.json
-    save_week_winners(week, winners)
-
     # Format and send confirmation
     message = format_winners_message(week, winners)
     await update.message.reply_text(message)
@@ -607,16 +733,9 @@ async def cmd_winners(update: Update, context: ContextTypes.DEFAULT_TYPE):
     Admin only, DM only
     """
     # Parse week number from args
-    if not context.args or len(context.args) != 1:
-        await update.message.reply_text("Usage: /winners <week>\nExample: /winners 1")
-        return
-
-    try:
-        week = int(context.args[0])
-        if week < 1 or week > 4:
-            raise ValueError()
-    except ValueError:
-        await update.message.reply_text("❌ Week must be a number between 1 and 4")
+    ok, week, error = parse_int_arg(context.args, lo=1, hi=4, label="week")
+    if not ok:
+        await update.message.reply_text(error or "Usage: /winners <week>\nExample: /winners 1")
         return
 
     # Get and format saved winners
@@ -631,10 +750,15 @@ async def cmd_backfill(update: Update, context: ContextTypes.DEFAULT_TYPE):
     /backfill command - Manually trigger backfill with default range
     Admin only, DM only
     """
-    await update.message.reply_text("🔄 Starting manual backfill with default range...")
+    if SCAN_LOCK.locked():
+        await update.message.reply_text(SCAN_BUSY_TEXT)
+        return
+
+    async with SCAN_LOCK:
+        await update.message.reply_text("🔄 Starting manual backfill with default range...")
 
-    # Run backfill
-    await smart_backfill(context.application)
+        # Run backfill
+        await smart_backfill(context.application)
 
     await update.message.reply_text("✅ Backfill complete! Check results above.")
 
@@ -651,16 +775,13 @@ async def cmd_scan(update: Update, context: ContextTypes.DEFAULT_TYPE):
     command_topic_id = update.message.message_thread_id if update.message.chat.type != 'private' else None
 
     # Parse arguments
-    if not context.args or len(context.args) != 2:
-        help_text = (
-            "📡 Usage: /scan <start_id> <end_id>\n\n"
-            "Example: /scan 103380 103580\n\n"
-            "⚠️ IMPORTANT - Run this command IN the topic you want to scan!\n"
-            "• Go to PnL Flex Challenge topic\n"
-            "• Find start ID: Right-click FIRST PnL card → Copy Link\n"
-            "• Find end ID: Right-click LATEST PnL card → Copy Link\n"
-            "• Type /scan <start> <end> IN THAT TOPIC\n\n"
-        )
+    ok, scan_range, error = parse_int_arg(context.args, expected=2, label="range")
+    if error:
+        await update.message.reply_text(error)
+        return
+
+    if not ok:
+        help_text = SCAN_USAGE
 
         if command_topic_id:
             help_text += f"✅ Current topic ID: {command_topic_id}\n"
@@ -675,18 +796,14 @@ async def cmd_scan(update: Update, context: ContextTypes.DEFAULT_TYPE):
         await update.message.reply_text(help_text)
         return
 
-    try:
-        start_id = int(context.args[0])
-        end_id = int(context.args[1])
-
-        if start_id >= end_id:
-            raise ValueError("Start ID must be less than end ID")
+    start_id, end_id = scan_range
 
-        if end_id - start_id > 5000:
-            raise ValueError("Range too large (max 5000 messages)")
+    if start_id >= end_id:
+        await update.message.reply_text("❌ Invalid range: Start ID must be less than end ID")
+        return
 
-    except ValueError as e:
-        await update.message.reply_text(f"❌ Invalid range: {e}")
+    if end_id - start_id > 5000:
+        await update.message.reply_text("❌ Invalid range: Range too large (max 5000 messages)")
         return
 
     # Warn if not in the correct topic
@@ -717,12 +834,18 @@ async def cmd_scan(update: Update, context: ContextTypes.DEFAULT_TYPE):
         f"💡 Tight message ID range recommended for best results!"
     )
 
-    await update.message.reply_text(status_msg)
+    # Checked right before acquiring (no await in between), so two scans can't both pass
+    if SCAN_LOCK.locked():
+        await update.message.reply_text(SCAN_BUSY_TEXT)
+        return
+
+    async with SCAN_LOCK:
+        await update.message.reply_text(status_msg)
 
-    # Run backfill with custom range
-    # Store the topic ID context for better filtering hints
-    context.bot_data['scan_topic_hint'] = command_topic_id
-    await smart_backfill(context.application, scan_range=(start_id, end_id))
+        # Run backfill with custom range
+        # Store the topic ID context for better filtering hints
+        context.bot_data['scan_topic_hint'] = command_topic_id
+        await smart_backfill(context.application, scan_range=(start_id, end_id))
 
     # Send completion message to the same chat where command was issued
     await update.message.reply_text("✅ Scan complete! Use /pnlrank to see updated leaderboard.")
@@ -736,30 +859,16 @@ async def cmd_checkmsg(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
     Example: /checkmsg 103450
     """
-    if not context.args or len(context.args) != 1:
-        await update.message.reply_text(
-            "Usage: /checkmsg <message_id>\n\n"
-            "Example: /checkmsg 103450\n\n"
-            "This helps you verify if a message ID is from the PnL Flex Challenge topic.\n"
-            "Use this to find the correct first/last message IDs for /scan."
-        )
-        return
-
-    try:
-        msg_id = int(context.args[0])
-    except ValueError:
-        await update.message.reply_text("❌ Invalid message ID")
+    ok, msg_id, error = parse_int_arg(context.args, label="message ID")
+    if not ok:
+        await update.message.reply_text(error or CHECKMSG_USAGE)
         return
 
     try:
         # Try to forward the message to probe it
         probe_chat_id = ADMIN_IDS[0]
 
-        forwarded = await context.bot.forward_message(
-            chat_id=probe_chat_id,
-            from_chat_id=CHAT_ID,
-            message_id=msg_id
-        )
+        forwarded = await forward_probe(context.bot, probe_chat_id, msg_id)
 
         # Analyze the message
         info = f"✅ Message {msg_id} found!\n\n"
@@ -785,13 +894,7 @@ async def cmd_checkmsg(update: Update, context: ContextTypes.DEFAULT_TYPE):
         info += f"💡 Target topic: {TOPIC_ID}\n"
 
         # Delete the forwarded probe
-        try:
-            await context.bot.delete_message(
-                chat_id=probe_chat_id,
-                message_id=forwarded.message_id
-            )
-        except Exception:
-            pass
+        await delete_probe(context.bot, probe_chat_id, forwarded.message_id)
 
         await update.message.reply_text(info)
 
@@ -805,55 +908,35 @@ async def cmd_debug(update: Update, context: ContextTypes.DEFAULT_TYPE):
     /debug command - Show debug information
     Admin only - helps diagnose issues
     """
-    from datetime import datetime
-
     now = datetime.now(IST)
     current_week = get_current_week()
 
-    lines = [
-        "🔧 Debug Information",
-        "",
-        f"📅 Current Time (IST): {now.strftime('%Y-%m-%d %H:%M:%S %Z')}",
-        f"📅 Campaign Start: {CAMPAIGN_START.strftime('%Y-%m-%d %H:%M:%S %Z')}",
-        f"📅 Campaign End: {CAMPAIGN_END.strftime('%Y-%m-%d %H:%M:%S %Z')}",
-        f"📊 Current Week: {current_week if current_week else 'Not in campaign period'}",
-        "",
-    ]
-
     # Check for system time issues
     if now.year != 2025:
-        lines.append("⚠️ WARNING: System time is WRONG!")
-        lines.append(f"⚠️ Server thinks it's {now.year}, should be 2025!")
-        lines.append("⚠️ This will cause all messages to be filtered out!")
-        lines.append("⚠️ Contact Railway support to fix server time")
-        lines.append("")
+        status = (
+            "⚠️ WARNING: System time is WRONG!\n"
+            f"⚠️ Server thinks it's {now.year}, should be 2025!\n"
+            "⚠️ This will cause all messages to be filtered out!\n"
+            "⚠️ Contact Railway support to fix server time"
+        )
     elif now < CAMPAIGN_START:
-        lines.append("⏰ Campaign hasn't started yet")
-        lines.append(f"⏰ Starts on: {CAMPAIGN_START.strftime('%Y-%m-%d %H:%M')}")
-        lines.append("")
+        status = (
+            "⏰ Campaign hasn't started yet\n"
+            f"⏰ Starts on: {CAMPAIGN_START.strftime('%Y-%m-%d %H:%M')}"
+        )
     elif now > CAMPAIGN_END:
-        lines.append("⏰ Campaign has ended")
-        lines.append(f"⏰ Ended on: {CAMPAIGN_END.strftime('%Y-%m-%d %H:%M')}")
-        lines.append("")
+        status = (
+            "⏰ Campaign has ended\n"
+            f"⏰ Ended on: {CAMPAIGN_END.strftime('%Y-%m-%d %H:%M')}"
+        )
     else:
-        lines.append("✅ System time is correct!")
-        lines.append("✅ Campaign is active!")
-        lines.append("")
-
-    lines.extend([
-        f"💬 Target Chat ID: {CHAT_ID}",
-        f"🎯 Target Topic ID: {TOPIC_ID}",
-        f"👨‍💼 Admin IDs: {', '.join(map(str, ADMIN_IDS))}",
-        "",
-        f"✅ Bot is running and receiving commands!",
-        "",
-        f"💡 To test real-time tracking:",
-        f"• Post a PnL card photo in topic {TOPIC_ID}",
-        f"• Check Railway logs for '📸 Photo received' message",
-        f"• Should see '✅✅ NEW SUBMISSION ADDED' if successful"
-    ])
-
-    await update.message.reply_text("\n".join(lines))
+        status = "✅ System time is correct!\n✅ Campaign is active!"
+
+    await update.message.reply_text(DEBUG_TEMPLATE.format_map({
+        'now': now.strftime('%Y-%m-%d %H:%M:%S %Z'),
+        'week': current_week if current_week else 'Not in campaign period',
+        'status': status
+    }))
 
 
 @admin_only
@@ -863,18 +946,7 @@ async def cmd_stats(update: Update, context: ContextTypes.DEFAULT_TYPE):
     /stats command - Show campaign statistics
     Admin only, DM only
     """
-    stats = get_stats()
-
-    lines = [
-        "📊 Campaign Statistics",
-        "",
-        f"👥 Total Participants: {stats['total_participants']}",
-        f"📸 Total Submissions: {stats['total_submissions']}",
-        f"📅 Campaign Start: {stats['campaign_start']}",
-        f"🔄 Last Updated: {stats['last_updated']}"
-    ]
-
-    await update.message.reply_text("\n".join(lines))
+    await update.message.reply_text(STATS_TEMPLATE.format_map(get_stats()))
 
 
 # ============================================================================
@@ -889,6 +961,17 @@ async def post_init(application: Application):
     # Use /scan command manually with correct message ID range for your specific topic
     # await smart_backfill(application)
 
+    # Python 3.12+: run new tasks eagerly up to their first real await, so handlers that
+    # answer from cache finish without an extra trip through the scheduler
+    if hasattr(asyncio, 'eager_task_factory'):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
+    # Warm the config and leaderboard caches so the first /pnlrank doesn't pay for them
+    get_show_points()
+    current_week = get_current_week()
+    if current_week:
+        get_leaderboard(current_week, limit=5)
+
     logger.info("✅ Startup complete!")
     logger.info("💡 Use /scan <start_id> <end_id> to manually scan your topic's messages")
 
@@ -899,10 +982,17 @@ def main():
     logger.info(f"📍 Monitoring Chat: {CHAT_ID}, Topic: {TOPIC_ID}")
     logger.info(f"👨‍💼 Admins: {ADMIN_IDS}")
 
+    # run_polling gets its loop from the current policy, so set it before building
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        logger.info("⚡ Using uvloop event loop")
+
     # Create application
+    # Concurrent updates keep /pnlrank and live photos responsive while a scan runs
     application = (
         Application.builder()
         .token(BOT_TOKEN)
+        .concurrent_updates(True)
         .post_init(post_init)
         .build()
     )
@@ -915,13 +1005,8 @@ def main():
         )
     )
 
-    # Add public commands (case-insensitive)
-    application.add_handler(
-        CommandHandler(
-            ['pnlrank', 'PNLRank', 'PNLRANK', 'pnlRank'],
-            cmd_pnlrank
-        )
-    )
+    # Add public commands (CommandHandler matches case-insensitively, so /PNLRank works too)
+    application.add_handler(CommandHandler('pnlrank', cmd_pnlrank))
 
     # Add admin commands
     application.add_handler(CommandHandler('adminboard', cmd_adminboard))
@@ -930,8 +1015,9 @@ def main():
     application.add_handler(CommandHandler('pointsoff', cmd_pointsoff))
     application.add_handler(CommandHandler('selectwinners', cmd_selectwinners))
     application.add_handler(CommandHandler('winners', cmd_winners))
-    application.add_handler(CommandHandler('backfill', cmd_backfill))
-    application.add_handler(CommandHandler('scan', cmd_scan))
+    # Long-running scans must not hold up other updates
+    application.add_handler(CommandHandler('backfill', cmd_backfill, block=False))
+    application.add_handler(CommandHandler('scan', cmd_scan, block=False))
     application.add_handler(CommandHandler('checkmsg', cmd_checkmsg))
     application.add_handler(CommandHandler('debug', cmd_debug))
     application.add_handler(CommandHandler('stats', cmd_stats))
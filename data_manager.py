@@ -7,13 +7,24 @@ Handles all JSON file operations with:
 - Thread-safe operations
 """
 
+import hashlib
+import heapq
 import json
+import random
 import shutil
 import os
+from collections import namedtuple
+import time
 import logging
 from pathlib import Path
 from datetime import datetime
-from utils import IST, format_timestamp
+from utils import IST, CAMPAIGN_START, format_timestamp, now_str
+
+# orjson is optional; the stdlib json module is used when it isn't installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +36,38 @@ SUBMISSIONS_FILE = DATA_DIR / 'submissions.json'
 WINNERS_FILE = DATA_DIR / 'winners.json'
 CONFIG_FILE = DATA_DIR / 'config.json'
 
+# Parsed JSON files keyed by path, as (st_mtime_ns, data). Loads reuse the entry while
+# the file is unchanged on disk. Callers share the cached dict, which is safe because
+# every mutation is followed by a save that re-primes the entry (or drops it on failure).
+_json_cache = {}
+
+# Last bytes written per path, as (st_mtime_ns, blake2b digest), so identical saves are skipped
+_json_digests = {}
+
+# Per-user (message_ids, photo_ids) sets for duplicate checks, built lazily for the
+# submissions dict currently in the load cache and reset when a different one is loaded
+_dedupe_index = {'data': None, 'users': {}}
+
+# One queued submission for add_submissions_bulk; fields follow add_submission's arguments
+PendingSubmission = namedtuple(
+    'PendingSubmission',
+    ['user_id', 'username', 'full_name', 'message_id', 'photo_id', 'timestamp', 'week']
+)
+
+# show_points is read on every /pnlrank but only changes via /pointson and /pointsoff
+SHOW_POINTS_TTL = 30  # seconds
+_show_points_cache = {'value': None, 'expires': 0.0}
+
+# Leaderboards are cached per (week, limit) and dropped on every submissions save.
+# The jittered TTL only bounds staleness from edits made outside the bot, and keeps
+# entries for different weeks from expiring together.
+LEADERBOARD_TTL = 15  # seconds
+LEADERBOARD_TTL_JITTER = 15  # seconds
+_leaderboard_cache = {}
+
+# Bumped on every submissions save so derived caches (e.g. rendered text) can tell they're stale
+_submissions_version = 0
+
 
 def get_default_submissions():
     """Return default structure for submissions.json"""
@@ -34,7 +77,7 @@ def get_default_submissions():
             "total_participants": 0,
             "total_submissions": 0,
             "campaign_start": format_timestamp(datetime(2025, 1, 15, 0, 1, tzinfo=IST)),
-            "last_updated": format_timestamp(datetime.now(IST))
+            "last_updated": now_str()
         }
     }
 
@@ -53,15 +96,35 @@ def get_default_config():
     }
 
 
+def _encode_json(data):
+    """Serialize data as indented UTF-8 JSON bytes (orjson when available)"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def _read_json(filepath):
+    """Parse a JSON file (orjson when available); raises json.JSONDecodeError if corrupted"""
+    if orjson is not None:
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        with open(filepath, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(filepath, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
 def save_json_atomic(filepath, data):
     """
     Atomically write JSON data to file with backup.
 
     This prevents data corruption during crashes by:
     1. Writing to a temporary file first
-    2. Creating a backup of the existing file
+    2. Creating a backup of the existing file (a hardlink where supported)
     3. Atomically moving the temp file to the target location
 
+    The write is skipped when the bytes match what this process last wrote
+    and the file hasn't been touched since.
+
     Args:
         filepath: Path object or string path to JSON file
         data: Dictionary to save as JSON
@@ -71,21 +134,47 @@ def save_json_atomic(filepath, data):
     backup_file = filepath.with_suffix('.json.backup')
 
     try:
+        payload = _encode_json(data)
+        digest = hashlib.blake2b(payload, digest_size=16).digest()
+
+        # Skip the rewrite (and backup) if nothing changed since our last save
+        last = _json_digests.get(filepath)
+        if last and filepath.exists() and last == (filepath.stat().st_mtime_ns, digest):
+            _json_cache[filepath] = (last[0], data)
+            logger.debug("Unchanged, skipped saving %s", filepath)
+            return
+
         # Write to temporary file
-        with open(temp_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        with open(temp_file, 'wb') as f:
+            f.write(payload)
 
-        # Create backup of existing file
+        # Create backup of existing file. os.replace below points filepath at the
+        # temp file's inode and never rewrites the old one in place, so a hardlink
+        # keeps the old contents without copying them.
         if filepath.exists():
-            shutil.copy(filepath, backup_file)
-            logger.debug(f"Created backup: {backup_file}")
-
-        # Atomic rename (replaces existing file)
-        shutil.move(str(temp_file), str(filepath))
-        logger.debug(f"Saved {filepath}")
+            if backup_file.exists():
+                backup_file.unlink()
+            try:
+                os.link(filepath, backup_file)
+            except OSError:
+                # Filesystems without hardlink support
+                shutil.copy(filepath, backup_file)
+            logger.debug("Created backup: %s", backup_file)
+
+        # Atomic rename (replaces existing file on POSIX and Windows alike)
+        os.replace(temp_file, filepath)
+        logger.debug("Saved %s", filepath)
+
+        # Prime the load cache so the next read skips parsing what we just wrote
+        mtime = filepath.stat().st_mtime_ns
+        _json_cache[filepath] = (mtime, data)
+        _json_digests[filepath] = (mtime, digest)
 
     except Exception as e:
         logger.error(f"Error saving {filepath}: {e}")
+        # The caller may have mutated the cached dict before this failed save
+        _json_cache.pop(filepath, None)
+        _json_digests.pop(filepath, None)
         # Clean up temp file if it exists
         if temp_file.exists():
             temp_file.unlink()
@@ -96,6 +185,8 @@ def load_json_safe(filepath, default_factory):
     """
     Safely load JSON with fallback to backup if corrupted.
 
+    Parsed data is cached and reused while the file's mtime is unchanged.
+
     Args:
         filepath: Path object or string path to JSON file
         default_factory: Function that returns default structure
@@ -109,10 +200,15 @@ def load_json_safe(filepath, default_factory):
     # Try loading main file
     try:
         if filepath.exists():
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                logger.debug(f"Loaded {filepath}")
-                return data
+            mtime = filepath.stat().st_mtime_ns
+            cached = _json_cache.get(filepath)
+            if cached and cached[0] == mtime:
+                return cached[1]
+
+            data = _read_json(filepath)
+            logger.debug("Loaded %s", filepath)
+            _json_cache[filepath] = (mtime, data)
+            return data
     except json.JSONDecodeError as e:
         logger.error(f"Corrupted JSON in {filepath}: {e}")
 
@@ -120,12 +216,11 @@ def load_json_safe(filepath, default_factory):
         try:
             if backup_file.exists():
                 logger.warning(f"Attempting to restore from backup: {backup_file}")
-                with open(backup_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    # Restore backup to main file
-                    save_json_atomic(filepath, data)
-                    logger.info(f"Successfully restored from backup")
-                    return data
+                data = _read_json(backup_file)
+                # Restore backup to main file
+                save_json_atomic(filepath, data)
+                logger.info(f"Successfully restored from backup")
+                return data
         except Exception as backup_error:
             logger.error(f"Backup restore failed: {backup_error}")
 
@@ -145,9 +240,17 @@ def load_submissions():
 
 def save_submissions(data):
     """Save submissions.json"""
+    global _submissions_version
     # Update last_updated timestamp
-    data['stats']['last_updated'] = format_timestamp(datetime.now(IST))
+    data['stats']['last_updated'] = now_str()
     save_json_atomic(SUBMISSIONS_FILE, data)
+    _leaderboard_cache.clear()
+    _submissions_version += 1
+
+
+def get_submissions_version():
+    """Return a counter that changes whenever submissions.json is saved"""
+    return _submissions_version
 
 
 def load_winners():
@@ -170,25 +273,60 @@ def save_config(data):
     save_json_atomic(CONFIG_FILE, data)
 
 
-def add_submission(user_id, username, full_name, message_id, photo_id, timestamp, week):
+def get_show_points():
     """
-    Add a new submission to the database.
+    Get the public points-visibility setting.
 
-    This is an idempotent operation - if message_id already exists, it's skipped.
+    Cached in-process for SHOW_POINTS_TTL seconds; set_show_points() keeps
+    the cache current, so the TTL only matters for edits made outside the bot.
+
+    Returns:
+        bool: True if points are shown on the public leaderboard
+    """
+    now = time.monotonic()
+    if _show_points_cache['value'] is None or now >= _show_points_cache['expires']:
+        _show_points_cache['value'] = load_config().get('show_points', True)
+        _show_points_cache['expires'] = now + SHOW_POINTS_TTL
+    return _show_points_cache['value']
+
+
+def set_show_points(value):
+    """
+    Persist the public points-visibility setting and refresh the cache.
 
     Args:
-        user_id: Telegram user ID
-        username: Telegram username (or "Unknown")
-        full_name: User's full name
-        message_id: Unique Telegram message ID
-        photo_id: Telegram file_id for duplicate detection
-        timestamp: datetime object
-        week: Week number (1-4)
+        value: True to show points, False to hide them
+    """
+    config = load_config()
+    config['show_points'] = value
+    save_config(config)
+    _show_points_cache['value'] = value
+    _show_points_cache['expires'] = time.monotonic() + SHOW_POINTS_TTL
+
+
+def _user_dedupe_sets(data, user_id_str):
+    """Return (message_ids, photo_ids) sets for a user in an already-loaded submissions dict"""
+    if _dedupe_index['data'] is not data:
+        _dedupe_index['data'] = data
+        _dedupe_index['users'] = {}
+
+    users = _dedupe_index['users']
+    if user_id_str not in users:
+        user_data = data['users'][user_id_str]
+        users[user_id_str] = (
+            {sub['message_id'] for sub in user_data['submissions']},
+            set(user_data['unique_photos'])
+        )
+    return users[user_id_str]
+
+
+def _apply_submission(data, user_id, username, full_name, message_id, photo_id, timestamp, week):
+    """
+    Apply one submission to an already-loaded submissions dict (no I/O).
 
     Returns:
         bool: True if submission was added, False if duplicate
     """
-    data = load_submissions()
     user_id_str = str(user_id)
 
     # Initialize user if not exists
@@ -205,16 +343,16 @@ def add_submission(user_id, username, full_name, message_id, photo_id, timestamp
         data['stats']['total_participants'] += 1
 
     user_data = data['users'][user_id_str]
+    message_ids, photo_ids = _user_dedupe_sets(data, user_id_str)
 
     # Check if message_id already exists (idempotent check)
-    existing_message_ids = [sub['message_id'] for sub in user_data['submissions']]
-    if message_id in existing_message_ids:
-        logger.debug(f"Message {message_id} already processed for user {user_id}")
+    if message_id in message_ids:
+        logger.debug("Message %s already processed for user %s", message_id, user_id)
         return False
 
     # Check for duplicate photo
-    if photo_id in user_data['unique_photos']:
-        logger.info(f"Duplicate photo {photo_id} detected for user {user_id}, ignoring")
+    if photo_id in photo_ids:
+        logger.info("Duplicate photo %s detected for user %s, ignoring", photo_id, user_id)
         return False
 
     # Add new submission
@@ -227,6 +365,8 @@ def add_submission(user_id, username, full_name, message_id, photo_id, timestamp
 
     # Add photo to unique list
     user_data['unique_photos'].append(photo_id)
+    message_ids.add(message_id)
+    photo_ids.add(photo_id)
 
     # Update points
     user_data['total_points'] += 1
@@ -240,23 +380,97 @@ def add_submission(user_id, username, full_name, message_id, photo_id, timestamp
     # Update global stats
     data['stats']['total_submissions'] += 1
 
+    return True
+
+
+def add_submission(user_id, username, full_name, message_id, photo_id, timestamp, week):
+    """
+    Add a new submission to the database.
+
+    This is an idempotent operation - if message_id already exists, it's skipped.
+
+    Args:
+        user_id: Telegram user ID
+        username: Telegram username (or "Unknown")
+        full_name: User's full name
+        message_id: Unique Telegram message ID
+        photo_id: Telegram file_id for duplicate detection
+        timestamp: datetime object
+        week: Week number (1-4)
+
+    Returns:
+        bool: True if submission was added, False if duplicate
+    """
+    data = load_submissions()
+
+    if not _apply_submission(data, user_id, username, full_name, message_id, photo_id, timestamp, week):
+        return False
+
     # Save atomically
     save_submissions(data)
-    logger.info(f"Added submission for user {user_id} (message {message_id}, week {week})")
+    logger.info("Added submission for user %s (message %s, week %s)", user_id, message_id, week)
 
     return True
 
 
-def get_leaderboard(week=None):
+def add_submissions_bulk(submissions):
+    """
+    Add many submissions with a single load and a single atomic save.
+
+    Used by the backfill scanner and the live photo group write, so a batch
+    costs one file rewrite instead of one per photo. Same idempotency rules
+    as add_submission, applied row by row in order.
+
+    Args:
+        submissions: List of PendingSubmission tuples
+
+    Returns:
+        list: One bool per input row - True if that row was added, False if duplicate
+    """
+    if not submissions:
+        return []
+
+    data = load_submissions()
+    results = [_apply_submission(data, *sub) for sub in submissions]
+    added_count = sum(results)
+
+    if added_count:
+        save_submissions(data)
+        logger.info(f"Added {added_count} submissions in bulk ({len(submissions) - added_count} duplicates)")
+
+    return results
+
+
+def _leaderboard_sort_key(entry):
+    """Sort by points (descending), then by username (ascending)"""
+    return (-entry['points'], entry['username'].lower())
+
+
+def get_leaderboard(week=None, limit=None):
     """
     Get leaderboard for specific week or all-time.
 
     Args:
         week: Week number (1-4) or None for all-time
+        limit: Only return the top N entries, or None for everyone
 
     Returns:
         list: Sorted list of (user_id, username, full_name, points)
     """
+    key = (week, limit)
+    now = time.monotonic()
+    cached = _leaderboard_cache.get(key)
+    if cached and now < cached[0]:
+        return list(cached[1])
+
+    leaderboard = _build_leaderboard(week, limit)
+    expires = now + LEADERBOARD_TTL + random.uniform(0, LEADERBOARD_TTL_JITTER)
+    _leaderboard_cache[key] = (expires, leaderboard)
+    return list(leaderboard)
+
+
+def _build_leaderboard(week, limit):
+    """Compute a leaderboard from submissions.json (uncached)"""
     data = load_submissions()
     leaderboard = []
 
@@ -274,8 +488,11 @@ def get_leaderboard(week=None):
                 'points': points
             })
 
-    # Sort by points (descending), then by username (ascending)
-    leaderboard.sort(key=lambda x: (-x['points'], x['username'].lower()))
+    # Top-N selection is O(N log K) instead of sorting every participant
+    if limit is not None:
+        return heapq.nsmallest(limit, leaderboard, key=_leaderboard_sort_key)
+
+    leaderboard.sort(key=_leaderboard_sort_key)
 
     return leaderboard
 
@@ -295,6 +512,33 @@ def save_week_winners(week, winners_list):
     logger.info(f"Saved winners for week {week}")
 
 
+def select_week_winners(week, count=5):
+    """
+    Select the current top entries for a week and save them as its winners.
+
+    Args:
+        week: Week number (1-4)
+        count: Number of winners to select (default 5)
+
+    Returns:
+        list: Saved winner dictionaries, or an empty list if the week has no submissions
+    """
+    winners = [
+        {
+            'rank': rank,
+            'username': entry['username'],
+            'full_name': entry['full_name'],
+            'points': entry['points']
+        }
+        for rank, entry in enumerate(get_leaderboard(week, limit=count), 1)
+    ]
+
+    if winners:
+        save_week_winners(week, winners)
+
+    return winners
+
+
 def get_week_winners(week):
     """
     Get saved winners for a specific week.
@@ -332,37 +576,33 @@ def get_engagement_stats(week=None):
         dict: Engagement statistics
     """
     data = load_submissions()
-    stats = data['stats'].copy()
+    stats = data['stats']
+    week_str = str(week) if week else None
 
-    # Find most active user
+    # Single pass: most active user, total posts and first-time participants this week
     most_active = None
     max_posts = 0
     total_posts = 0
+    new_this_week = 0
 
-    for user_id, user_data in data['users'].items():
+    for user_data in data['users'].values():
         points = user_data['total_points']
         total_posts += points
         if points > max_posts:
             max_posts = points
             most_active = user_data['username']
 
+        # New this week = this is the only week they have points in
+        if week_str:
+            weekly_points = user_data['weekly_points']
+            if weekly_points.get(week_str, 0) > 0 and sum(1 for p in weekly_points.values() if p > 0) == 1:
+                new_this_week += 1
+
     # Calculate average posts per user
     total_users = stats['total_participants']
     avg_posts = total_posts / total_users if total_users > 0 else 0
 
-    # Count new participants this week
-    new_this_week = 0
-    if week:
-        for user_id, user_data in data['users'].items():
-            if str(week) in user_data['weekly_points']:
-                # Check if this is their first week
-                weeks_participated = [w for w in user_data['weekly_points'].keys() if user_data['weekly_points'][w] > 0]
-                if len(weeks_participated) == 1 and str(week) in weeks_participated:
-                    new_this_week += 1
-
     # Calculate campaign day
-    from datetime import datetime
-    from utils import CAMPAIGN_START
     now = datetime.now(IST)
     campaign_day = (now - CAMPAIGN_START).days + 1
 
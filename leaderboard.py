@@ -4,7 +4,15 @@ Handles formatting and display of leaderboards with configurable point visibilit
 """
 
 import logging
-from data_manager import get_leaderboard, load_config, get_week_winners
+import time
+from data_manager import (
+    get_leaderboard,
+    get_show_points,
+    get_week_winners,
+    get_engagement_stats,
+    get_submissions_version,
+    LEADERBOARD_TTL
+)
 from utils import get_current_week, get_week_date_range
 
 logger = logging.getLogger(__name__)
@@ -19,6 +27,28 @@ RANK_EMOJIS = {
 }
 
 
+# Rendered public leaderboards keyed by (week, show_points, limit, show_user_ids).
+# Entries are reused until submissions are saved again or LEADERBOARD_TTL passes.
+_rendered_cache = {}
+
+# Engagement stats layout, built once; {details} holds the optional lines
+ENGAGEMENT_TEMPLATE = (
+    "📊 PnL Flex Challenge - Engagement Stats\n"
+    "\n"
+    "👥 Total Participants: {total_participants} users\n"
+    "📸 Total Submissions: {total_submissions} images\n"
+    "📅 Campaign Day: {campaign_day} of 28\n"
+    "\n"
+    "{details}"
+    "📈 Avg Posts per User: {avg_posts_per_user}"
+)
+
+
+def rank_emoji(rank):
+    """Return the medal for a rank, or "N." past the medal positions"""
+    return RANK_EMOJIS.get(rank) or f"{rank}."
+
+
 def format_leaderboard(week=None, show_points=None, limit=5, show_user_ids=False):
     """
     Format leaderboard for display.
@@ -38,23 +68,37 @@ def format_leaderboard(week=None, show_points=None, limit=5, show_user_ids=False
         if week is None:
             return "❌ Campaign hasn't started yet!"
 
+    # Get config for point visibility
+    if show_points is None:
+        show_points = get_show_points()
+
+    # Reuse the rendered text while submissions are unchanged
+    key = (week, show_points, limit, show_user_ids)
+    version = get_submissions_version()
+    now = time.monotonic()
+    cached = _rendered_cache.get(key)
+    if cached and cached[0] == version and now < cached[1]:
+        return cached[2]
+
+    text = _render_leaderboard(week, show_points, limit, show_user_ids)
+    _rendered_cache[key] = (version, now + LEADERBOARD_TTL, text)
+    return text
+
+
+def _render_leaderboard(week, show_points, limit, show_user_ids):
+    """Build the leaderboard text for format_leaderboard (uncached)"""
     # Get leaderboard data
-    leaderboard = get_leaderboard(week)
+    leaderboard = get_leaderboard(week, limit=limit)
 
     if not leaderboard:
         return f"📊 No submissions yet for Week {week}"
 
-    # Get config for point visibility
-    if show_points is None:
-        config = load_config()
-        show_points = config.get('show_points', True)
-
     # Build header
     lines = [f"🏆 PnL Flex Challenge - Week {week}", ""]
 
     # Format top entries
-    for idx, entry in enumerate(leaderboard[:limit], 1):
-        emoji = RANK_EMOJIS.get(idx, f"{idx}.")
+    for idx, entry in enumerate(leaderboard, 1):
+        emoji = rank_emoji(idx)
         username = entry['username']
 
         # Format username with @ if it's not "Unknown"
@@ -96,21 +140,20 @@ def format_admin_dashboard(week=None):
             return "❌ Campaign hasn't started yet!"
 
     # Get leaderboard data
-    leaderboard = get_leaderboard(week)
+    leaderboard = get_leaderboard(week, limit=10)
 
     if not leaderboard:
         return f"📊 No submissions yet for Week {week}"
 
     # Get config
-    config = load_config()
-    show_points = config.get('show_points', True)
+    show_points = get_show_points()
 
     # Build header
     lines = [f"🔐 Admin Dashboard - Week {week}", ""]
 
     # Format top 10 with user IDs
-    for idx, entry in enumerate(leaderboard[:10], 1):
-        emoji = RANK_EMOJIS.get(idx, f"{idx}.")
+    for idx, entry in enumerate(leaderboard, 1):
+        emoji = rank_emoji(idx)
         username = entry['username']
 
         # Format username
@@ -142,34 +185,22 @@ def format_engagement_stats(week=None):
     Returns:
         str: Formatted engagement stats
     """
-    from data_manager import get_engagement_stats, get_leaderboard
-    from utils import get_current_week
-
     # Get current week if not specified
     if week is None:
         week = get_current_week()
 
     stats = get_engagement_stats(week)
 
-    lines = [
-        "📊 PnL Flex Challenge - Engagement Stats",
-        "",
-        f"👥 Total Participants: {stats['total_participants']} users",
-        f"📸 Total Submissions: {stats['total_submissions']} images",
-        f"📅 Campaign Day: {stats['campaign_day']} of 28",
-        ""
-    ]
-
+    # Optional lines, each ending in a newline so the template stays fixed
+    details = ""
     if week:
-        lines.append(f"🆕 New Participants This Week: {stats['new_this_week']} users")
+        details += f"🆕 New Participants This Week: {stats['new_this_week']} users\n"
 
     if stats['most_active_user']:
         most_active_display = f"@{stats['most_active_user']}" if stats['most_active_user'] != "Unknown" else "Unknown User"
-        lines.append(f"🔥 Most Active: {most_active_display} ({stats['most_active_count']} posts)")
+        details += f"🔥 Most Active: {most_active_display} ({stats['most_active_count']} posts)\n"
 
-    lines.append(f"📈 Avg Posts per User: {stats['avg_posts_per_user']}")
-
-    return "\n".join(lines)
+    return ENGAGEMENT_TEMPLATE.format_map(dict(stats, details=details))
 
 
 def format_winners_message(week, winners):
@@ -187,7 +218,7 @@ def format_winners_message(week, winners):
 
     for winner in winners:
         rank = winner['rank']
-        emoji = RANK_EMOJIS.get(rank, f"{rank}.")
+        emoji = rank_emoji(rank)
         username = winner['username']
 
         # Format username
@@ -225,7 +256,7 @@ def format_saved_winners(week):
 
     for winner in winners:
         rank = winner['rank']
-        emoji = RANK_EMOJIS.get(rank, f"{rank}.")
+        emoji = rank_emoji(rank)
         username = winner['username']
 
         # Format username
@@ -293,7 +324,7 @@ def format_sync_notification(sync_stats):
             lines.append("New Top 3:")
 
         for idx, entry in enumerate(top_3, 1):
-            emoji = RANK_EMOJIS.get(idx, f"{idx}.")
+            emoji = rank_emoji(idx)
             username = entry['username']
 
             if username and username != "Unknown":
@@ -8,6 +8,8 @@ Helper functions for PnL Flex Challenge Leaderboard Bot
 from datetime import datetime, timedelta
 import pytz
 import os
+import re
+import time
 import logging
 
 logger = logging.getLogger(__name__)
@@ -25,7 +27,10 @@ CHAT_ID = int(os.getenv('CHAT_ID', '-1001868775086'))
 TOPIC_ID = int(os.getenv('TOPIC_ID', '103380'))
 
 # Admin IDs from environment (comma-separated)
+# The list keeps env order (first admin is the scan probe chat);
+# the frozenset gives O(1) membership checks on every admin command
 ADMIN_IDS = [int(x.strip()) for x in os.getenv('ADMIN_IDS', '1064156047').split(',')]
+ADMIN_ID_SET = frozenset(ADMIN_IDS)
 
 
 def calculate_week_number(timestamp):
@@ -106,7 +111,43 @@ def is_admin(user_id):
     Returns:
         bool: True if user is admin
     """
-    return user_id in ADMIN_IDS
+    return user_id in ADMIN_ID_SET
+
+
+def parse_int_arg(args, expected=1, lo=None, hi=None, label="value"):
+    """
+    Parse integer command arguments with optional bounds.
+
+    Args:
+        args: context.args from the command
+        expected: Number of arguments the command takes
+        lo: Minimum allowed value (inclusive) or None
+        hi: Maximum allowed value (inclusive) or None
+        label: Name used in the error message
+
+    Returns:
+        tuple: (ok, value, error_message) - value is an int when expected is 1,
+        otherwise a tuple of ints. error_message is None when the argument
+        count is wrong, so the caller can reply with its usage text instead.
+    """
+    if not args or len(args) != expected:
+        return False, None, None
+
+    if lo is not None and hi is not None:
+        error = f"❌ {label.capitalize()} must be a number between {lo} and {hi}"
+    else:
+        error = f"❌ Invalid {label}"
+
+    try:
+        values = tuple(int(arg) for arg in args)
+    except ValueError:
+        return False, None, error
+
+    for value in values:
+        if (lo is not None and value < lo) or (hi is not None and value > hi):
+            return False, None, error
+
+    return True, values[0] if expected == 1 else values, None
 
 
 def format_timestamp(dt):
@@ -127,6 +168,26 @@ def format_timestamp(dt):
     return dt.strftime('%Y-%m-%dT%H:%M:%S%z')
 
 
+# format_timestamp(now) only changes once a second; now_str() reuses it within the second
+_now_str_cache = {'second': None, 'value': None}
+
+
+def now_str():
+    """
+    Get the current IST time formatted like format_timestamp.
+
+    The string is cached per wall-clock second, since that is its resolution.
+
+    Returns:
+        str: Formatted current timestamp in IST
+    """
+    second = int(time.time())
+    if _now_str_cache['second'] != second:
+        _now_str_cache['value'] = format_timestamp(datetime.fromtimestamp(second, IST))
+        _now_str_cache['second'] = second
+    return _now_str_cache['value']
+
+
 def parse_timestamp(timestamp_str):
     """
     Parse ISO format timestamp string to datetime.
@@ -142,6 +203,12 @@ def parse_timestamp(timestamp_str):
     return dt.astimezone(IST)
 
 
+# Log masking patterns, compiled once; SensitiveFormatter runs them on every record
+BOT_TOKEN_RE = re.compile(r'\d{10}:[A-Za-z0-9_-]{35}')
+USER_ID_RE = re.compile(r'user_id["\s:]+(\d{8,})')
+USER_ID_JSON_RE = re.compile(r'"user_id":\s*"?(\d{8,})"?')
+
+
 class SensitiveFormatter(logging.Formatter):
     """
     Custom log formatter that masks sensitive information.
@@ -149,14 +216,13 @@ class SensitiveFormatter(logging.Formatter):
     """
 
     def format(self, record):
-        import re
         message = super().format(record)
 
         # Mask bot token (format: 1234567890:ABCdefGHIjklMNOpqrsTUVwxyz)
-        message = re.sub(r'\d{10}:[A-Za-z0-9_-]{35}', '[BOT_TOKEN_MASKED]', message)
+        message = BOT_TOKEN_RE.sub('[BOT_TOKEN_MASKED]', message)
 
         # Mask user IDs in various formats
-        message = re.sub(r'user_id["\s:]+(\d{8,})', r'user_id: [MASKED]', message)
-        message = re.sub(r'"user_id":\s*"?(\d{8,})"?', r'"user_id": "[MASKED]"', message)
+        message = USER_ID_RE.sub(r'user_id: [MASKED]', message)
+        message = USER_ID_JSON_RE.sub(r'"user_id": "[MASKED]"', message)
 
         return message